@@ -1,11 +1,23 @@
+import asyncio
+import orjson
 from fastapi import APIRouter
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from statusLogger import StatusMonitor
 
 router = APIRouter()
 
 monitor_instance: StatusMonitor = None
 
+# Seconds between SSE keep-alive comments on an idle /stream
+STREAM_PING_INTERVAL = 15
+
+# Seconds before a /stream is closed; EventSource reconnects and re-syncs,
+# and open streams can't hold up server shutdown for longer than this
+STREAM_MAX_LIFETIME = 60
+
+# Milliseconds the browser waits before reconnecting a closed /stream
+STREAM_RETRY_MS = 1000
+
 
 def set_monitor_instance(instance: StatusMonitor):
     global monitor_instance
@@ -24,12 +36,39 @@ async def health():
 
 @router.get("/events")
 async def get_events():
-    return {"events": monitor_instance.latest_events}
+    return Response(content=monitor_instance.events_json(), media_type="application/json")
 
 
-@router.get("/live", response_class=HTMLResponse)
-async def live_view():
-    return """
+@router.get("/stream")
+async def stream_events():
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STREAM_MAX_LIFETIME
+
+        # Subscribe inside the generator so the finally below always pairs with it
+        queue = monitor_instance.subscribe()
+        try:
+            yield b"retry: %d\n\n" % STREAM_RETRY_MS
+
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+
+                try:
+                    line = await asyncio.wait_for(queue.get(), min(STREAM_PING_INTERVAL, remaining))
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+                    continue
+                yield b"data: " + orjson.dumps(line) + b"\n\n"
+        finally:
+            monitor_instance.unsubscribe(queue)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+# Static /live page, encoded once at import instead of on every request
+LIVE_PAGE = """
     <html>
         <head>
             <title>OpenAI Status Monitor</title>
@@ -46,26 +85,69 @@ async def live_view():
             </style>
 
             <script>
-                async function fetchEvents() {
-                    const response = await fetch('/events');
-                    const data = await response.json();
+                const MAX_EVENTS = 50;
 
+                function renderEvent(event) {
+                    const div = document.createElement("div");
+                    div.className = "event";
+                    div.textContent = event;
+                    return div;
+                }
+
+                // Events pushed while a snapshot is loading (null when idle)
+                let pending = null;
+
+                function prependEvent(event) {
                     const container = document.getElementById("events");
-                    container.innerHTML = "";
-
-                    data.events.forEach(event => {
-                        const div = document.createElement("div");
-                        div.className = "event";
-                        div.textContent = event;
-                        container.appendChild(div);
-                    });
+                    container.prepend(renderEvent(event));
+
+                    while (container.children.length > MAX_EVENTS) {
+                        container.lastElementChild.remove();
+                    }
+                }
+
+                async function fetchEvents() {
+                    pending = [];
+
+                    try {
+                        const response = await fetch('/events');
+                        const data = await response.json();
+
+                        const container = document.getElementById("events");
+                        container.innerHTML = "";
+
+                        data.events.forEach(event => {
+                            container.appendChild(renderEvent(event));
+                        });
+
+                        // Re-apply pushes that raced the snapshot, unless it already has them
+                        const known = new Set(data.events);
+                        pending.forEach(event => {
+                            if (!known.has(event)) {
+                                prependEvent(event);
+                            }
+                        });
+                    } finally {
+                        pending = null;
+                    }
                 }
 
-                // Poll every 5 seconds
-                setInterval(fetchEvents, 5000);
+                window.onload = () => {
+                    const source = new EventSource('/stream');
 
-                // Load immediately
-                window.onload = fetchEvents;
+                    // Full snapshot on every (re)connect, then push updates
+                    source.onopen = fetchEvents;
+
+                    source.onmessage = e => {
+                        const event = JSON.parse(e.data);
+
+                        if (pending) {
+                            pending.push(event);
+                        } else {
+                            prependEvent(event);
+                        }
+                    };
+                };
             </script>
         </head>
 
@@ -74,4 +156,9 @@ async def live_view():
             <div id="events">Loading...</div>
         </body>
     </html>
-    """
\ No newline at end of file
+    """.encode("utf-8")
+
+
+@router.get("/live", response_class=HTMLResponse)
+async def live_view():
+    return HTMLResponse(content=LIVE_PAGE)
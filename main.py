@@ -1,5 +1,5 @@
 import os
-import asyncio
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import uvicorn
@@ -8,20 +8,24 @@ from statusLogger import StatusMonitor
 from api import router, set_monitor_instance
 
 
+# Bare messages so event output looks like the README example
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(), format="%(message)s")
+logger = logging.getLogger(__name__)
+
 PROVIDERS = ["https://status.openai.com/history.atom"]
 monitor = StatusMonitor(PROVIDERS)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("🚀 Starting OpenAI Status Monitor...")
+    logger.info("🚀 Starting OpenAI Status Monitor...")
 
-    task = asyncio.create_task(monitor.start())
+    monitor.start()
 
     yield
 
-    task.cancel()
-    print("🛑 Shutting down monitor...")
+    await monitor.stop()
+    logger.info("🛑 Shutting down monitor...")
 
 
 app = FastAPI(lifespan=lifespan)
@@ -32,4 +36,5 @@ app.include_router(router)
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    # Don't let lingering /stream connections stall shutdown
+    uvicorn.run(app, host="0.0.0.0", port=port, timeout_graceful_shutdown=5)
\ No newline at end of file
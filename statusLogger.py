@@ -1,44 +1,197 @@
 import asyncio
 import aiohttp
-import feedparser
+import orjson
 import re
 import html
-from datetime import datetime
-from typing import Optional, List
-import os
-import fastapi
+import hashlib
+import logging
+import random
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Optional, Dict, List, Set, Tuple
+from urllib.parse import urlsplit
+from lxml import etree
+
+logger = logging.getLogger("status_monitor")
+# Silent unless the application configures logging (see main.py)
+logger.addHandler(logging.NullHandler())
+
+# Atom namespace used by status.openai.com/history.atom
+NS = {"a": "http://www.w3.org/2005/Atom"}
+
+# Patterns used when cleaning entry summaries
+_RE_LI = re.compile(r"<li>(.*?)\s*\(")
+_RE_TAG = re.compile(r"<.*?>")
+_RE_WS = re.compile(r"\s+")
+
+# Everything from the first of these markers on is dropped from the status text
+_RE_CUT = re.compile(r"affected\s+components|all\s+impacted\s+services", re.IGNORECASE)
+
+# Sent with every feed request
+USER_AGENT = "openai-status-logger/1.0"
+
+# Retry policy: in-poll retries for connection errors, backoff across polls otherwise
+MAX_FETCH_ATTEMPTS = 3
+MAX_BACKOFF_SECONDS = 60
+
+# Token bucket shared by all feeds on one host
+HOST_BURST = 5
+HOST_REQUESTS_PER_SECOND = 1.0
+
+# Pending events buffered per /stream client before new ones are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Upper bound on remembered entry ids; far larger than any single feed page
+SEEN_ENTRIES_SIZE = 4096
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    # Numeric header values only (counts or seconds); HTTP-date Retry-After
+    # falls back to our own backoff
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+# ==========================================
+# Host Rate Limiter
+# ==========================================
+
+class _HostLimiter:
+    def __init__(self, capacity: int = HOST_BURST, refill_rate: float = HOST_REQUESTS_PER_SECOND):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def acquire(self):
+        # The lock queues waiters so they are served in order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+
+    def update(self, headers):
+        self._refill()
+
+        remaining = _parse_number(headers.get("X-RateLimit-Remaining"))
+        if remaining is not None:
+            self.tokens = min(self.tokens, remaining)
+
+        # Go into debt so nobody on this host asks again before Retry-After;
+        # capped like FeedClient's backoff so acquire() never outwaits it
+        retry_after = _parse_number(headers.get("Retry-After"))
+        if retry_after is not None:
+            retry_after = min(retry_after, MAX_BACKOFF_SECONDS)
+            self.tokens = min(self.tokens, 1 - retry_after * self.refill_rate)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.refill_rate)
+        self.last_update = now
+
 
 # ==========================================
 # Feed Client (Single Responsibility)
 # ==========================================
 
 class FeedClient:
-    def __init__(self, feed_url: str):
+    def __init__(self, feed_url: str, limiter: Optional[_HostLimiter] = None):
         self.feed_url = feed_url
+        self.limiter = limiter or _HostLimiter()
         self.etag: Optional[str] = None
         self.last_modified: Optional[str] = None
+        self._body_digest: Optional[bytes] = None
+        # Consecutive failed polls and when the next poll may go out
+        self._failures = 0
+        self._retry_at = 0.0
+
+    async def fetch(self, session: aiohttp.ClientSession) -> Optional[bytes]:
+        # While the feed keeps failing, skip polls until the backoff expires
+        if time.monotonic() < self._retry_at:
+            return None
 
-    async def fetch(self, session: aiohttp.ClientSession) -> Optional[str]:
-        headers = {}
+        headers = {
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": USER_AGENT,
+        }
 
         if self.etag:
             headers["If-None-Match"] = self.etag
         if self.last_modified:
             headers["If-Modified-Since"] = self.last_modified
 
-        async with session.get(self.feed_url, headers=headers) as response:
-            if response.status == 304:
-                return None
-
-            response.raise_for_status()
-
-            content = await response.text()
-
-            # Update cache headers
-            self.etag = response.headers.get("ETag")
-            self.last_modified = response.headers.get("Last-Modified")
-
-            return content
+        try:
+            content = await self._request(session, headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            retry_after = None
+            if isinstance(e, aiohttp.ClientResponseError) and e.headers:
+                retry_after = e.headers.get("Retry-After")
+            self._failures += 1
+            self._retry_at = time.monotonic() + self._backoff_delay(self._failures, retry_after)
+            raise
+
+        self._failures = 0
+        self._retry_at = 0.0
+        return content
+
+    async def _request(self, session: aiohttp.ClientSession, headers: dict) -> Optional[bytes]:
+        # Retry only connection-level errors in-poll; HTTP errors back off across polls
+        for attempt in range(MAX_FETCH_ATTEMPTS):
+            try:
+                async with self.limiter, session.get(self.feed_url, headers=headers) as response:
+                    self.limiter.update(response.headers)
+
+                    if response.status == 304:
+                        return None
+
+                    response.raise_for_status()
+                    return await self._read(response)
+
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                if attempt == MAX_FETCH_ATTEMPTS - 1:
+                    raise
+
+            await asyncio.sleep(self._backoff_delay(attempt, None))
+
+    async def _read(self, response: aiohttp.ClientResponse) -> Optional[bytes]:
+        # Raw bytes skip aiohttp's charset detection; lxml decodes per the XML prolog
+        content = await response.read()
+
+        # Update cache headers
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+        # Some CDNs strip validators and answer 200 with the same body;
+        # treat a byte-identical body like a 304
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if digest == self._body_digest:
+            return None
+        self._body_digest = digest
+
+        return content
+
+    @staticmethod
+    def _backoff_delay(attempt: int, retry_after: Optional[str]) -> float:
+        # Honour a numeric Retry-After (429/503), else exponential backoff with jitter
+        seconds = _parse_number(retry_after)
+        if seconds is not None:
+            return min(MAX_BACKOFF_SECONDS, seconds)
+        return min(MAX_BACKOFF_SECONDS, 2 ** attempt) + random.uniform(0, 1)
 
 
 # ==========================================
@@ -47,34 +200,47 @@ class FeedClient:
 
 class FeedParser:
     def __init__(self):
-        self.seen_entries = set()
+        # Insertion-ordered so the oldest ids can be evicted (used as an LRU set)
+        self.seen_entries: "OrderedDict[str, None]" = OrderedDict()
+        # Component combinations are few, so share one product string per combination
+        self._product_cache: Dict[str, str] = {}
 
-    def parse(self, raw_feed: str, first_run: bool) -> List[dict]:
+    def parse(self, raw_feed: bytes, first_run: bool) -> List[dict]:
         events = []
-        feed = feedparser.parse(raw_feed)
+        # Committed to seen_entries only after every entry parsed, so a failure
+        # part-way through can't mark earlier entries seen without emitting them
+        new_ids: Dict[str, None] = {}
+        root = etree.fromstring(raw_feed)
 
-        for entry in feed.entries:
-            entry_id = getattr(entry, "id", getattr(entry, "link", None))
+        for entry in root.iterfind("a:entry", NS):
+            entry_id = entry.findtext("a:id", namespaces=NS)
             if not entry_id:
+                link = entry.find("a:link", NS)
+                entry_id = link.get("href") if link is not None else None
+            if not entry_id or entry_id in new_ids:
                 continue
 
             # After first run → skip already seen
             if not first_run and entry_id in self.seen_entries:
+                # Ids still present in the feed stay fresh and are never evicted
+                self.seen_entries.move_to_end(entry_id)
                 continue
 
-            self.seen_entries.add(entry_id)
-
             timestamp = self._extract_timestamp(entry)
-            raw_html = getattr(entry, "summary", "")
-
-            components = self._extract_components(raw_html)
-            status_message = self._extract_status_message(raw_html)
+            product, status_message = self._extract_details(entry)
 
             events.append({
                 "timestamp": timestamp,  # store as datetime first
-                "product": f"OpenAI API - {components}",
+                "product": product,
                 "status": status_message
             })
+            new_ids[entry_id] = None
+
+        for entry_id in new_ids:
+            self.seen_entries[entry_id] = None
+            self.seen_entries.move_to_end(entry_id)
+            if len(self.seen_entries) > SEEN_ENTRIES_SIZE:
+                self.seen_entries.popitem(last=False)
 
         # Sort newest first
         events.sort(key=lambda x: x["timestamp"], reverse=False)
@@ -85,25 +251,51 @@ class FeedParser:
 
         return events
 
+    def _extract_details(self, entry) -> Tuple[str, str]:
+        raw_html = (
+            entry.findtext("a:summary", namespaces=NS)
+            or entry.findtext("a:content", namespaces=NS)
+            or ""
+        )
+
+        components = self._extract_components(raw_html)
+        status_message = self._extract_status_message(raw_html)
+        product = self._product_cache.get(components)
+        if product is None:
+            product = self._product_cache[components] = f"OpenAI API - {components}"
+        return product, status_message
+
     def _extract_timestamp(self, entry):
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
-            return datetime(*entry.published_parsed[:6])
-        if hasattr(entry, "updated_parsed") and entry.updated_parsed:
-            return datetime(*entry.updated_parsed[:6])
+        for tag in ("a:published", "a:updated"):
+            value = (entry.findtext(tag, namespaces=NS) or "").strip()
+            if not value:
+                continue
+            try:
+                if value[-1] in "Zz":
+                    # Common case: already UTC, parse straight to a naive datetime
+                    return datetime.fromisoformat(value[:-1])
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                # Unparseable date: try the next tag, like a missing one
+                continue
+            if parsed.tzinfo is not None:
+                # Keep naive UTC so it sorts alongside utcnow()
+                parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+            return parsed
         return datetime.utcnow()
 
     def _extract_components(self, raw_html: str) -> str:
-        components = re.findall(r"<li>(.*?)\s*\(", raw_html)
+        components = _RE_LI.findall(raw_html)
         return ", ".join(components) if components else "General"
 
     def _extract_status_message(self, raw_html: str) -> str:
-        text = html.unescape(raw_html)
-        text = re.sub(r"<.*?>", "", text)
-        text = re.split(r"Affected components", text, flags=re.IGNORECASE)[0]
-        text = text.replace("Status:", "").strip()
-        text = re.sub(r"\s+", " ", text)
-        text = re.split(r"All impacted services", text, flags=re.IGNORECASE)[0]
-        return text.strip()
+        # Truncate once before any cleaning so later passes touch less text
+        m = _RE_CUT.search(raw_html)
+        if m:
+            raw_html = raw_html[:m.start()]
+
+        text = _RE_TAG.sub("", html.unescape(raw_html))
+        return _RE_WS.sub(" ", text.replace("Status:", "")).strip()
 
 # ==========================================
 # Status Monitor (Orchestrator)
@@ -112,31 +304,82 @@ class FeedParser:
 class StatusMonitor:
     def __init__(self, feed_urls: List[str], interval: int = 10):
         self.feed_urls = feed_urls
-        self.clients = {url: FeedClient(url) for url in feed_urls}
+        # One limiter per host, shared by every feed served from it
+        self._limiters: Dict[str, _HostLimiter] = {}
+        self.clients = {url: FeedClient(url, self._limiter_for(url)) for url in feed_urls}
         self.parser = FeedParser()
         self.interval = interval
-        self.latest_events: List[str] = []
+        self.latest_events: deque = deque(maxlen=50)
+        # Serialized /events body, rebuilt lazily after new events arrive
+        self._events_json: Optional[bytes] = None
+        # One queue per connected /stream client
+        self._subscribers: Set[asyncio.Queue] = set()
         self._first_run = True
+        self._task: Optional[asyncio.Task] = None
+
+    def _limiter_for(self, url: str) -> _HostLimiter:
+        host = urlsplit(url).hostname or ""
+        if host not in self._limiters:
+            self._limiters[host] = _HostLimiter()
+        return self._limiters[host]
+
+    def start(self) -> asyncio.Task:
+        # Idempotent: a second startup hook must not spawn another polling loop
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="status-monitor")
+        return self._task
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            # The loop had already died; report it instead of failing shutdown
+            logger.exception("Status monitor task failed")
+        self._task = None
+
+    async def _run(self):
+        # Reuse keep-alive connections and cache DNS across polls
+        connector = aiohttp.TCPConnector(
+            limit=64, limit_per_host=8, keepalive_timeout=75, ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(total=30, connect=10)
 
-    async def start(self):
-        async with aiohttp.ClientSession() as session:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
             while True:
                 try:
                     for url in self.feed_urls:
                         raw_feed = await self.clients[url].fetch(session)
 
                         if raw_feed:
-                            events = self.parser.parse(raw_feed, self._first_run)
+                            # Off the event loop so API handlers stay responsive;
+                            # only this loop touches the parser, so no locking needed
+                            events = await asyncio.to_thread(
+                                self.parser.parse, raw_feed, self._first_run
+                            )
 
                             for event in events:
                                 self._add_event(event)
 
                             self._first_run = False
 
-                except Exception as e:
-                    print("[ERROR]:", e)
+                except Exception:
+                    logger.exception("Feed poll failed")
 
-                await asyncio.sleep(self.interval)
+                # Anchor polls to t0 + k*interval so fetch/parse time doesn't add drift;
+                # if a slow tick overran, skip the missed slots instead of bursting
+                now = loop.time()
+                next_tick += self.interval
+                if next_tick < now:
+                    next_tick += ((now - next_tick) // self.interval + 1) * self.interval
+                await asyncio.sleep(next_tick - now)
 
     def _add_event(self, event: dict):
         formatted = (
@@ -145,10 +388,28 @@ class StatusMonitor:
             f"Status: {event['status']}"
         )
 
-        print(formatted + "\n")
+        logger.info("%s", formatted)
+
+        # Insert at top (maxlen keeps only the last 50)
+        self.latest_events.appendleft(formatted)
+        self._events_json = None
+
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(formatted)
+            except asyncio.QueueFull:
+                # Slow client; it will resync from /events when it reconnects
+                pass
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
 
-        # Insert at top
-        self.latest_events.insert(0, formatted)
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
 
-        # Keep only last 50
-        self.latest_events = self.latest_events[:50]
\ No newline at end of file
+    def events_json(self) -> bytes:
+        if self._events_json is None:
+            self._events_json = orjson.dumps({"events": list(self.latest_events)})
+        return self._events_json
@@ -0,0 +1,155 @@
+import asyncio
+import socket
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import statusLogger
+from statusLogger import FeedClient, _HostLimiter
+
+
+class StubFeed:
+    """aiohttp server answering /feed with a scripted list of responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append(request)
+        status, headers, body = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        return web.Response(status=status, headers=headers, body=body)
+
+    def run(self, scenario):
+        async def main():
+            app = web.Application()
+            app.router.add_get("/feed", self.handle)
+            async with TestServer(app) as server:
+                # Generous limiter so rate limiting doesn't slow these tests down
+                client = FeedClient(str(server.make_url("/feed")), _HostLimiter(100, 100.0))
+                async with aiohttp.ClientSession() as session:
+                    return await scenario(client, session)
+
+        return asyncio.run(main())
+
+
+def _remaining_backoff(client: FeedClient) -> float:
+    return client._retry_at - time.monotonic()
+
+
+def test_fetch_returns_body_and_sends_validators():
+    stub = StubFeed((200, {"ETag": '"v1"'}, b"<feed/>"), (304, {}, b""))
+
+    async def scenario(client, session):
+        first = await client.fetch(session)
+        second = await client.fetch(session)
+        return first, second
+
+    assert stub.run(scenario) == (b"<feed/>", None)
+    assert stub.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_fetch_returns_none_for_identical_body():
+    stub = StubFeed((200, {}, b"<feed/>"))
+
+    async def scenario(client, session):
+        return [await client.fetch(session) for _ in range(2)]
+
+    assert stub.run(scenario) == [b"<feed/>", None]
+
+
+def test_http_error_is_not_retried_in_poll_and_skips_next_poll():
+    stub = StubFeed((500, {}, b""))
+
+    async def scenario(client, session):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.fetch(session)
+        # Still inside the backoff window: no request goes out
+        assert await client.fetch(session) is None
+        return client
+
+    client = stub.run(scenario)
+    assert len(stub.requests) == 1
+    assert client._failures == 1
+    assert 1 < _remaining_backoff(client) <= 3
+
+
+def test_backoff_grows_across_polls_and_is_capped():
+    stub = StubFeed((503, {}, b""))
+
+    async def scenario(client, session):
+        delays = []
+        for _ in range(8):
+            client._retry_at = 0.0  # pretend the previous window has expired
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client.fetch(session)
+            delays.append(_remaining_backoff(client))
+        return delays
+
+    delays = stub.run(scenario)
+    assert len(stub.requests) == 8
+    for n, delay in enumerate(delays, start=1):
+        expected = min(statusLogger.MAX_BACKOFF_SECONDS, 2 ** n)
+        assert expected - 0.5 < delay <= expected + 1
+
+
+@pytest.mark.parametrize("retry_after, expected", [("30", 30), ("120", 60)])
+def test_retry_after_sets_backoff(retry_after, expected):
+    stub = StubFeed((429, {"Retry-After": retry_after}, b""))
+
+    async def scenario(client, session):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.fetch(session)
+        return client
+
+    client = stub.run(scenario)
+    assert expected - 0.5 < _remaining_backoff(client) <= expected
+
+
+def test_success_resets_failures():
+    stub = StubFeed((500, {}, b""), (200, {}, b"<feed/>"))
+
+    async def scenario(client, session):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.fetch(session)
+        client._retry_at = 0.0
+        body = await client.fetch(session)
+        return client, body
+
+    client, body = stub.run(scenario)
+    assert body == b"<feed/>"
+    assert client._failures == 0
+    assert client._retry_at == 0.0
+
+
+def test_connection_errors_are_retried_in_poll(monkeypatch, closed_port):
+    monkeypatch.setattr(FeedClient, "_backoff_delay", staticmethod(lambda attempt, retry_after: 0))
+    attempts = []
+    original = aiohttp.ClientSession.get
+
+    def counting_get(self, *args, **kwargs):
+        attempts.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(aiohttp.ClientSession, "get", counting_get)
+
+    async def main():
+        client = FeedClient(f"http://127.0.0.1:{closed_port}/feed")
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await client.fetch(session)
+        return client
+
+    client = asyncio.run(main())
+    assert len(attempts) == statusLogger.MAX_FETCH_ATTEMPTS
+    assert client._failures == 1
+
+
+@pytest.fixture
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,131 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from statusLogger import FeedParser
+
+FIXTURE = (Path(__file__).parent / "fixtures" / "history.atom").read_bytes()
+
+
+def _feed(*entries: str) -> bytes:
+    return (
+        '<feed xmlns="http://www.w3.org/2005/Atom">' + "".join(entries) + "</feed>"
+    ).encode("utf-8")
+
+
+def _entry(entry_id: str, published: str = "", updated: str = "", summary: str = "") -> str:
+    return (
+        f"<entry><id>{entry_id}</id>"
+        f"<published>{published}</published><updated>{updated}</updated>"
+        f"<summary>{summary}</summary></entry>"
+    )
+
+
+def test_parse_fixture_feed():
+    events = FeedParser().parse(FIXTURE, first_run=True)
+
+    assert events == [
+        {
+            "timestamp": "2026-01-05 10:00:00",
+            "product": "OpenAI API - General",
+            "status": "Resolved - fixed.",
+        },
+        {
+            "timestamp": "2026-01-07 22:53:27",
+            "product": "OpenAI API - Responses, Chat Completions",
+            "status": "Degraded performance",
+        },
+        {
+            "timestamp": "2026-01-08 02:30:50",
+            "product": "OpenAI API - Codex",
+            "status": "Elevated error rates detected",
+        },
+    ]
+
+
+def test_parse_skips_seen_entries_after_first_run():
+    parser = FeedParser()
+    parser.parse(FIXTURE, first_run=True)
+
+    assert parser.parse(FIXTURE, first_run=False) == []
+
+    events = parser.parse(
+        _feed(_entry("new", published="2026-01-09T00:00:00Z", summary="New incident")),
+        first_run=False,
+    )
+    assert [e["status"] for e in events] == ["New incident"]
+
+
+@pytest.mark.parametrize("published", ["   ", "not a date", "2026-13-45T00:00:00Z"])
+def test_parse_falls_back_to_updated_on_bad_published(published):
+    events = FeedParser().parse(
+        _feed(_entry("a", published=published, updated="2026-01-05T10:00:00Z")),
+        first_run=True,
+    )
+
+    assert events[0]["timestamp"] == "2026-01-05 10:00:00"
+
+
+def test_parse_falls_back_to_now_without_usable_dates():
+    before = datetime.utcnow().replace(microsecond=0)
+    events = FeedParser().parse(
+        _feed(_entry("a", published="   "), _entry("b", published="z")),
+        first_run=True,
+    )
+
+    assert len(events) == 2
+    for event in events:
+        assert datetime.strptime(event["timestamp"], "%Y-%m-%d %H:%M:%S") >= before
+
+
+def test_failed_parse_does_not_mark_entries_seen(monkeypatch):
+    parser = FeedParser()
+    feed = _feed(
+        _entry("a", published="2026-01-05T10:00:00Z", summary="first"),
+        _entry("b", published="2026-01-05T11:00:00Z", summary="second"),
+    )
+
+    original = parser._extract_details
+    calls = []
+
+    def flaky(entry):
+        calls.append(entry)
+        if len(calls) == 2:
+            raise RuntimeError("boom")
+        return original(entry)
+
+    monkeypatch.setattr(parser, "_extract_details", flaky)
+    with pytest.raises(RuntimeError):
+        parser.parse(feed, first_run=False)
+    assert not parser.seen_entries
+
+    monkeypatch.setattr(parser, "_extract_details", original)
+    events = parser.parse(feed, first_run=False)
+    assert [e["status"] for e in events] == ["first", "second"]
+
+
+# Expected values are what the pre-lxml implementation returned for the same input
+@pytest.mark.parametrize(
+    "raw_html, expected",
+    [
+        (
+            "<p><strong>Status:</strong> Elevated error rates detected</p>"
+            "<p>Affected components</p><ul><li>Codex (Degraded performance)</li></ul>",
+            "Elevated error rates detected",
+        ),
+        ("<p>Resolved - fixed. All\nimpacted services recovered</p>", "Resolved - fixed."),
+        (
+            "<p>We are   investigating &amp; monitoring.</p>\n"
+            "<p>AFFECTED COMPONENTS</p><ul><li>API (Outage)</li></ul>",
+            "We are investigating & monitoring.",
+        ),
+        (
+            "Fix for İstanbul users deployed. <b>Affected components</b><ul><li>API (Outage)</li></ul>",
+            "Fix for İstanbul users deployed.",
+        ),
+        ("Plain text update", "Plain text update"),
+    ],
+)
+def test_extract_status_message(raw_html, expected):
+    assert FeedParser()._extract_status_message(raw_html) == expected
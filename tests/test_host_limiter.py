@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+import statusLogger
+from statusLogger import StatusMonitor, _HostLimiter
+
+
+def _timed_acquires(limiter: _HostLimiter, count: int) -> float:
+    async def main():
+        start = time.monotonic()
+        for _ in range(count):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    return asyncio.run(main())
+
+
+def test_burst_is_served_without_waiting():
+    assert _timed_acquires(_HostLimiter(capacity=5, refill_rate=1.0), 5) < 0.1
+
+
+def test_acquire_waits_for_refill_once_empty():
+    elapsed = _timed_acquires(_HostLimiter(capacity=1, refill_rate=20.0), 3)
+    assert elapsed >= 0.09
+
+
+def test_rate_limit_remaining_caps_tokens():
+    limiter = _HostLimiter(capacity=5, refill_rate=1.0)
+    limiter.update({"X-RateLimit-Remaining": "0"})
+    assert limiter.tokens < 0.1
+
+
+def test_retry_after_debt_is_capped():
+    limiter = _HostLimiter(capacity=5, refill_rate=1.0)
+    limiter.update({"Retry-After": "120"})
+    assert limiter.tokens >= 1 - statusLogger.MAX_BACKOFF_SECONDS * limiter.refill_rate
+    assert limiter.tokens < 1 - 59 * limiter.refill_rate
+
+
+def test_non_numeric_headers_are_ignored():
+    limiter = _HostLimiter(capacity=5, refill_rate=1.0)
+    limiter.update({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT", "X-RateLimit-Remaining": "n/a"})
+    assert limiter.tokens > 4.9
+
+
+def test_feeds_on_the_same_host_share_a_limiter():
+    monitor = StatusMonitor([
+        "https://status.example.com/a.atom",
+        "https://status.example.com/b.atom",
+        "https://other.example.com/c.atom",
+    ])
+    a, b, c = (monitor.clients[url].limiter for url in monitor.feed_urls)
+
+    assert a is b
+    assert a is not c
+    assert len(monitor._limiters) == 2